@@ -179,6 +179,11 @@ class RenderedTaskInstanceFields(Base):
             # Fetch Top X records given dag_id & task_id ordered by Execution Date
             tis_to_keep = tis_to_keep_query.all()
 
+            # Fewer records than the limit means there is nothing to delete,
+            # so skip the extra DELETE round trip
+            if len(tis_to_keep) < num_to_keep:
+                return
+
             filter_tis = [
                 not_(
                     and_(
@@ -190,4 +195,8 @@ class RenderedTaskInstanceFields(Base):
                 for ti in tis_to_keep
             ]
 
-            session.query(cls).filter(and_(*filter_tis)).delete(synchronize_session=False)
+            session.query(cls).filter(
+                cls.dag_id == dag_id,
+                cls.task_id == task_id,
+                and_(*filter_tis),
+            ).delete(synchronize_session=False)